@@ -3,6 +3,8 @@ import re
 import sqlite3
 import time
 import random
+import asyncio
+import signal
 from datetime import datetime
 from pathlib import Path
 from telegram import Update
@@ -22,22 +24,99 @@ load_dotenv("data.env")
 
 # ================= CONFIGURATION =================
 TOKEN = os.getenv("BOT_TOKEN")
+# Extra bots hosted by the same process: "groupa=<token>,groupb=<token>"
+BOT_TOKENS = os.getenv("BOT_TOKENS", "")
+DEFAULT_TENANT = "default"
+TENANT_NAME_REGEX = re.compile(r'^[a-z][a-z0-9_]*$')  # becomes a table-name prefix
+SMS_CACHE_TTL = 5.0  # seconds; shorter than the retry wait in get_verification
 EMAIL_REGEX = re.compile(r'^([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+\.com)$', re.ASCII)
 DB_PATH = Path("appleid_bot.db")
+BACKUP_DIR = Path(os.getenv("BACKUP_DIR", DB_PATH.parent / "backups"))
+BACKUP_INTERVAL_HOURS = float(os.getenv("BACKUP_INTERVAL_HOURS", "6"))  # 0 disables scheduled snapshots
+BACKUP_RETENTION = int(os.getenv("BACKUP_RETENTION", "7"))  # snapshots to keep, 0 keeps all
+BACKUP_PAGES_PER_STEP = 64  # small steps keep each hold on the DB to a few ms
+BACKUP_STEP_SLEEP = 0.005  # seconds between steps so handlers can get in
 
 # ================= IN-MEMORY STORAGE =================
 ADMINS = {"@Elias_H"}
 ADMIN_IDS = {int(os.getenv('MY_BOT_ID'))}
-user_data_store = {}  # {chat_id: {state: data}}
-admin_data_store = {}  # {admin_id: {command: state}}
+user_data_store = {}  # {tenant: {chat_id: {state: data}}}
+admin_data_store = {}  # {tenant: {admin_id: {command: state}}}
+_sms_cache = {}  # {clean_phone: (fetched_at, apple_contents)}
+_sms_inflight = {}  # {clean_phone: asyncio.Task}
+_db_conn = None
+_backup_lock = None  # asyncio.Lock, created on the running loop
+_backup_task = None
+backup_stats = {"runs": 0, "failures": 0, "last": None}
+
+# ================= TENANTS =================
+def load_bot_tokens() -> dict:
+    """Build {tenant: token} from BOT_TOKEN and BOT_TOKENS"""
+    tokens = {}
+    if TOKEN:
+        tokens[DEFAULT_TENANT] = TOKEN
+    for entry in BOT_TOKENS.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, sep, token = entry.partition("=")
+        name = name.strip().lower()
+        token = token.strip()
+        if not sep or not token or name == DEFAULT_TENANT or not is_valid_tenant(name):
+            raise ValueError(f"Invalid BOT_TOKENS entry for tenant {name!r}")
+        if name in tokens:
+            raise ValueError(f"Duplicate BOT_TOKENS entry for tenant {name!r}")
+        # Two Applications polling one token get 409 Conflict from Telegram
+        if token in tokens.values():
+            raise ValueError(f"BOT_TOKENS entry for tenant {name!r} reuses another bot's token")
+        tokens[name] = token
+    if not tokens:
+        raise ValueError("No bot token configured (set BOT_TOKEN or BOT_TOKENS)")
+    return tokens
+
+def is_valid_tenant(name: str) -> bool:
+    """Tenant names must be usable as SQLite table prefixes"""
+    # SQLite reserves every table name starting with "sqlite"
+    return bool(TENANT_NAME_REGEX.fullmatch(name)) and not name.startswith("sqlite")
+
+def get_tenant(context: ContextTypes.DEFAULT_TYPE = None) -> str:
+    """Return the tenant of the Application handling this update"""
+    if context is None:
+        return DEFAULT_TENANT
+    return context.bot_data.get("tenant", DEFAULT_TENANT)
+
+def get_user_store(context: ContextTypes.DEFAULT_TYPE = None) -> dict:
+    """Per-tenant user state, so the same chat can talk to several bots"""
+    return user_data_store.setdefault(get_tenant(context), {})
+
+def get_admin_store(context: ContextTypes.DEFAULT_TYPE = None) -> dict:
+    """Per-tenant admin command state"""
+    return admin_data_store.setdefault(get_tenant(context), {})
+
+def _table(name: str, tenant: str) -> str:
+    """Tenant-specific table name; the default tenant keeps the original tables"""
+    if tenant == DEFAULT_TENANT:
+        return name
+    if not is_valid_tenant(tenant):
+        raise ValueError(f"Invalid tenant name: {tenant!r}")
+    return f"{tenant}_{name}"
 
 # ================= DATABASE SETUP =================
-def init_db():
+def get_connection() -> sqlite3.Connection:
+    """Return the process-wide connection shared by every hosted bot"""
+    global _db_conn
+    if _db_conn is None:
+        _db_conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    return _db_conn
+
+def init_db(tenant: str = DEFAULT_TENANT):
     """Initialize the database with required tables"""
-    with sqlite3.connect(DB_PATH) as conn:
+    pairs_table = _table("registered_pairs", tenant)
+    verified_table = _table("verified_users", tenant)
+    with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS registered_pairs (
+        cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {pairs_table} (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             apple_id TEXT NOT NULL UNIQUE,
             phone TEXT NOT NULL,
@@ -47,24 +126,24 @@ def init_db():
         )
         """)
         # Add new table for verified users
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS verified_users (
+        cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {verified_table} (
             chat_id INTEGER PRIMARY KEY,
             apple_id TEXT NOT NULL,
             verified_at TEXT NOT NULL,
-            FOREIGN KEY(apple_id) REFERENCES registered_pairs(apple_id)
+            FOREIGN KEY(apple_id) REFERENCES {pairs_table}(apple_id)
         )
         """)
         conn.commit()
 
 # ================= DATABASE OPERATIONS =================
-def add_pair(apple_id: str, phone: str, added_by: str) -> bool:
+def add_pair(apple_id: str, phone: str, added_by: str, tenant: str = DEFAULT_TENANT) -> bool:
     """Add a new Apple ID-phone pair to the database"""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-            INSERT INTO registered_pairs 
+            cursor.execute(f"""
+            INSERT INTO {_table("registered_pairs", tenant)} 
             (apple_id, phone, added_by, added_at)
             VALUES (?, ?, ?, ?)
             """, (apple_id, phone, added_by, datetime.now().isoformat()))
@@ -73,36 +152,36 @@ def add_pair(apple_id: str, phone: str, added_by: str) -> bool:
     except sqlite3.IntegrityError:
         return False
 
-def update_phone(apple_id: str, new_phone: str) -> bool:
+def update_phone(apple_id: str, new_phone: str, tenant: str = DEFAULT_TENANT) -> bool:
     """Update phone number for existing Apple ID"""
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-        UPDATE registered_pairs 
+        cursor.execute(f"""
+        UPDATE {_table("registered_pairs", tenant)} 
         SET phone = ?, last_updated = ?
         WHERE LOWER(apple_id) = LOWER(?)
         """, (new_phone, datetime.now().isoformat(), apple_id))
         conn.commit()
     return cursor.rowcount > 0
 
-def remove_pair(apple_id: str) -> bool:
+def remove_pair(apple_id: str, tenant: str = DEFAULT_TENANT) -> bool:
     """Remove an Apple ID-phone pair from the database"""
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-        DELETE FROM registered_pairs 
+        cursor.execute(f"""
+        DELETE FROM {_table("registered_pairs", tenant)} 
         WHERE LOWER(apple_id) = LOWER(?)
         """, (apple_id,))
         conn.commit()
     return cursor.rowcount > 0
 
-def get_all_pairs() -> list:
+def get_all_pairs(tenant: str = DEFAULT_TENANT) -> list:
     """Retrieve all registered pairs"""
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
+        cursor.execute(f"""
         SELECT apple_id, phone, added_by, added_at, last_updated 
-        FROM registered_pairs
+        FROM {_table("registered_pairs", tenant)}
         """)
         return [{
             "apple_id": row[0],
@@ -112,23 +191,23 @@ def get_all_pairs() -> list:
             "last_updated": row[4]
         } for row in cursor.fetchall()]
 
-def apple_id_exists(apple_id: str) -> bool:
+def apple_id_exists(apple_id: str, tenant: str = DEFAULT_TENANT) -> bool:
     """Check if Apple ID exists in database"""
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-        SELECT 1 FROM registered_pairs 
+        cursor.execute(f"""
+        SELECT 1 FROM {_table("registered_pairs", tenant)} 
         WHERE LOWER(apple_id) = LOWER(?)
         """, (apple_id,))
         return cursor.fetchone() is not None
 
-def add_verified_user(chat_id: int, apple_id: str) -> bool:
+def add_verified_user(chat_id: int, apple_id: str, tenant: str = DEFAULT_TENANT) -> bool:
     """Add a verified user to the database"""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-            INSERT OR REPLACE INTO verified_users 
+            cursor.execute(f"""
+            INSERT OR REPLACE INTO {_table("verified_users", tenant)} 
             (chat_id, apple_id, verified_at)
             VALUES (?, ?, ?)
             """, (chat_id, apple_id, datetime.now().isoformat()))
@@ -137,28 +216,147 @@ def add_verified_user(chat_id: int, apple_id: str) -> bool:
     except sqlite3.Error:
         return False
 
-def get_verified_apple_id(chat_id: int) -> str | None:
+def get_verified_apple_id(chat_id: int, tenant: str = DEFAULT_TENANT) -> str | None:
     """Get verified Apple ID for a chat if exists"""
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-        SELECT apple_id FROM verified_users 
+        cursor.execute(f"""
+        SELECT apple_id FROM {_table("verified_users", tenant)} 
         WHERE chat_id = ?
         """, (chat_id,))
         result = cursor.fetchone()
         return result[0] if result else None
 
-def remove_verified_user(chat_id: int) -> bool:
+def remove_verified_user(chat_id: int, tenant: str = DEFAULT_TENANT) -> bool:
     """Remove a verified user from the database"""
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-        DELETE FROM verified_users 
+        cursor.execute(f"""
+        DELETE FROM {_table("verified_users", tenant)} 
         WHERE chat_id = ?
         """, (chat_id,))
         conn.commit()
     return cursor.rowcount > 0
 
+# ================= BACKUPS =================
+def backup_database() -> dict:
+    """Copy the live database with SQLite's online backup API, a few pages at a time"""
+    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+    # Partial copies left by a process killed mid-backup; run_backup holds the lock here
+    for leftover in BACKUP_DIR.glob(f"{DB_PATH.stem}-*.db.tmp"):
+        leftover.unlink(missing_ok=True)
+    target = BACKUP_DIR / f"{DB_PATH.stem}-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}.db"
+    tmp_target = target.with_suffix(".db.tmp")
+
+    step_times = []
+    last_step = [time.perf_counter()]
+
+    def progress(status, remaining, total):
+        # BUSY/LOCKED means the step was retried after sqlite3 slept; that wait isn't a step
+        if status in (sqlite3.SQLITE_OK, sqlite3.SQLITE_DONE):
+            step_times.append(time.perf_counter() - last_step[0])
+            # sqlite3 only sleeps on BUSY, so pause here to let handlers use the connection
+            if remaining:
+                time.sleep(BACKUP_STEP_SLEEP)
+        last_step[0] = time.perf_counter()
+
+    started = time.perf_counter()
+    dest = sqlite3.connect(tmp_target)
+    # The last step would otherwise fsync the copy while holding the shared connection
+    dest.execute("PRAGMA synchronous = OFF")
+    try:
+        # Steps on the shared connection pick up writes made through it mid-backup
+        get_connection().backup(
+            dest,
+            pages=BACKUP_PAGES_PER_STEP,
+            progress=progress,
+            sleep=BACKUP_STEP_SLEEP
+        )
+    except Exception:
+        dest.close()
+        tmp_target.unlink(missing_ok=True)
+        raise
+    dest.close()
+    with open(tmp_target, "rb") as f:
+        os.fsync(f.fileno())
+    tmp_target.replace(target)
+
+    return {
+        "file": str(target),
+        "size_bytes": target.stat().st_size,
+        "steps": len(step_times),
+        "duration_ms": (time.perf_counter() - started) * 1000,
+        "max_step_ms": max(step_times, default=0.0) * 1000,
+        "finished_at": datetime.now().isoformat()
+    }
+
+def prune_backups(keep: int = BACKUP_RETENTION) -> list:
+    """Delete the oldest snapshots beyond the retention count"""
+    snapshots = list_backups()
+    removed = snapshots[:-keep] if keep > 0 else []
+    for path in removed:
+        path.unlink(missing_ok=True)
+    return removed
+
+async def run_backup() -> dict:
+    """Run one backup off the event loop; concurrent callers wait for the running one"""
+    global _backup_lock
+    if _backup_lock is None:
+        _backup_lock = asyncio.Lock()
+
+    async with _backup_lock:
+        try:
+            stats = await asyncio.to_thread(backup_database)
+        except Exception as e:
+            backup_stats["failures"] += 1
+            print(f"Backup failed: {e}")
+            raise
+        stats["pruned"] = len(prune_backups())
+        backup_stats["runs"] += 1
+        backup_stats["last"] = stats
+        print(
+            f"Backup {stats['file']}: {stats['size_bytes']} bytes, {stats['steps']} steps, "
+            f"{stats['duration_ms']:.0f} ms total, {stats['max_step_ms']:.1f} ms max step"
+        )
+        return stats
+
+def list_backups() -> list:
+    """Snapshots in BACKUP_DIR, oldest first"""
+    return sorted(BACKUP_DIR.glob(f"{DB_PATH.stem}-*.db"))
+
+async def backup_scheduler() -> None:
+    """Take a snapshot every BACKUP_INTERVAL_HOURS"""
+    interval = BACKUP_INTERVAL_HOURS * 3600
+    # Count from the newest snapshot so frequent redeploys don't keep resetting the timer
+    snapshots = list_backups()
+    age = time.time() - snapshots[-1].stat().st_mtime if snapshots else interval
+    delay = max(interval - age, 0)
+    while True:
+        await asyncio.sleep(delay)
+        try:
+            await run_backup()
+        except Exception:
+            pass  # Already counted and logged; try again next interval
+        delay = interval
+
+def start_backup_scheduler() -> None:
+    """Start the scheduled backups once per process, however many bots are hosted"""
+    global _backup_task
+    if BACKUP_INTERVAL_HOURS > 0 and _backup_task is None:
+        _backup_task = asyncio.create_task(backup_scheduler())
+
+async def stop_backup_scheduler() -> None:
+    """Cancel the scheduled backups and wait for the task to finish"""
+    global _backup_task
+    if _backup_task is None:
+        return
+    task, _backup_task = _backup_task, None
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
 # ================= SMS SCRAPER FUNCTION =================
 def get_apple_messages_content(phone_number):
     """Scrape Apple verification messages from the phone number"""
@@ -236,6 +434,30 @@ def get_apple_messages_content(phone_number):
         print(f"Error: {e}")
         return []
 
+async def fetch_apple_messages(phone_number: str) -> list:
+    """Shared fetch for all hosted bots: short-lived cache plus one in-flight scrape per phone"""
+    clean_phone = re.sub(r'[^\d]', '', phone_number)
+
+    cached = _sms_cache.get(clean_phone)
+    if cached and time.monotonic() - cached[0] < SMS_CACHE_TTL:
+        return list(cached[1])
+
+    task = _sms_inflight.get(clean_phone)
+    if task is None:
+        task = asyncio.create_task(_scrape_and_cache(clean_phone, phone_number))
+        _sms_inflight[clean_phone] = task
+    # Shielded so one bot's cancelled handler doesn't abort the scrape for the others
+    return list(await asyncio.shield(task))
+
+async def _scrape_and_cache(clean_phone: str, phone_number: str) -> list:
+    """Run the blocking scraper off the event loop that every bot shares"""
+    try:
+        apple_contents = await asyncio.to_thread(get_apple_messages_content, phone_number)
+        _sms_cache[clean_phone] = (time.monotonic(), apple_contents)
+        return apple_contents
+    finally:
+        _sms_inflight.pop(clean_phone, None)
+
 # ================= HELPER FUNCTIONS =================
 def is_admin(user) -> bool:
     """Check if user is admin by username or ID"""
@@ -261,18 +483,20 @@ async def show_admin_commands(update: Update, context: ContextTypes.DEFAULT_TYPE
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Enhanced start command with registration options"""
     chat_id = update.effective_chat.id
+    tenant = get_tenant(context)
+    user_store = get_user_store(context)
     
     if is_admin(update.effective_user):
         await show_admin_commands(update)
         return
     
     # Always clear previous state
-    user_data_store[chat_id] = {}
+    user_store[chat_id] = {}
     
-    existing_apple_id = get_verified_apple_id(chat_id)
+    existing_apple_id = get_verified_apple_id(chat_id, tenant=tenant)
     if existing_apple_id:
         # Store both state and existing ID
-        user_data_store[chat_id] = {
+        user_store[chat_id] = {
             "state": "choose_option",
             "existing_apple_id": existing_apple_id
         }
@@ -289,7 +513,7 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
             reply_markup=reply_markup
         )
     else:
-        user_data_store[chat_id] = {"state": "awaiting_apple_id"}
+        user_store[chat_id] = {"state": "awaiting_apple_id"}
         await update.message.reply_text(
             "Please enter your Apple ID (format: name@domain.com):",
             reply_markup=ReplyKeyboardRemove()
@@ -297,14 +521,16 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
 async def handle_user_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat_id = update.effective_chat.id
-    user_data = user_data_store.get(chat_id, {})
+    tenant = get_tenant(context)
+    user_store = get_user_store(context)
+    user_data = user_store.get(chat_id, {})
     text = update.message.text.strip()
 
     if user_data.get("state") == "choose_option":
         if text == "Use existing Apple ID":
             apple_id = user_data["existing_apple_id"]
-            if apple_id_exists(apple_id):
-                user_data_store[chat_id] = {
+            if apple_id_exists(apple_id, tenant=tenant):
+                user_store[chat_id] = {
                     "verified": True,
                     "apple_id": apple_id
                 }
@@ -318,14 +544,14 @@ async def handle_user_message(update: Update, context: ContextTypes.DEFAULT_TYPE
                     "❌ This Apple ID is no longer valid. Please enter a new one:",
                     reply_markup=ReplyKeyboardRemove()
                 )
-                user_data_store[chat_id] = {"state": "awaiting_apple_id"}
+                user_store[chat_id] = {"state": "awaiting_apple_id"}
         
         elif text == "Enter new Apple ID":
             await update.message.reply_text(
                 "Please enter your new Apple ID:",
                 reply_markup=ReplyKeyboardRemove()
             )
-            user_data_store[chat_id] = {"state": "awaiting_apple_id"}
+            user_store[chat_id] = {"state": "awaiting_apple_id"}
         
         return
 
@@ -334,9 +560,9 @@ async def handle_user_message(update: Update, context: ContextTypes.DEFAULT_TYPE
             await update.message.reply_text("❌ Invalid format! Please enter a valid Apple ID:")
             return
             
-        if apple_id_exists(text):
-            add_verified_user(chat_id, text)
-            user_data_store[chat_id] = {
+        if apple_id_exists(text, tenant=tenant):
+            add_verified_user(chat_id, text, tenant=tenant)
+            user_store[chat_id] = {
                 "verified": True,
                 "apple_id": text
             }
@@ -348,12 +574,14 @@ async def handle_user_message(update: Update, context: ContextTypes.DEFAULT_TYPE
 async def get_verification(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Verification process for users with SMS scraping"""
     chat_id = update.effective_chat.id
+    tenant = get_tenant(context)
+    user_store = get_user_store(context)
     
     # Check memory first, then database
-    if not user_data_store.get(chat_id, {}).get("verified"):
-        apple_id = get_verified_apple_id(chat_id)
+    if not user_store.get(chat_id, {}).get("verified"):
+        apple_id = get_verified_apple_id(chat_id, tenant=tenant)
         if apple_id:
-            user_data_store[chat_id] = {
+            user_store[chat_id] = {
                 "verified": True,
                 "apple_id": apple_id
             }
@@ -362,16 +590,16 @@ async def get_verification(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             return
     
     # Get the user's Apple ID from storage
-    apple_id = user_data_store[chat_id].get("apple_id")
+    apple_id = user_store[chat_id].get("apple_id")
     if not apple_id:
         await update.message.reply_text("❌ Your Apple ID couldn't be found. Please register again.")
         return
     
     # Get the associated phone number from database
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-        SELECT phone FROM registered_pairs 
+        cursor.execute(f"""
+        SELECT phone FROM {_table("registered_pairs", tenant)} 
         WHERE LOWER(apple_id) = LOWER(?)
         """, (apple_id,))
         result = cursor.fetchone()
@@ -390,7 +618,7 @@ async def get_verification(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     
     while retry_count <= max_retries:
         try:
-            apple_messages = get_apple_messages_content(phone_number)
+            apple_messages = await fetch_apple_messages(phone_number)
             
             if apple_messages:
                 break
@@ -401,7 +629,7 @@ async def get_verification(update: Update, context: ContextTypes.DEFAULT_TYPE) -
                         f"⏳ No messages found yet (attempt {retry_count + 1}/{max_retries + 1})\n"
                         f"Waiting {wait_time:.1f} seconds before retry..."
                     )
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                 retry_count += 1
         except Exception as e:
             await update.message.reply_text(f"⚠️ Error during search: {str(e)}")
@@ -429,6 +657,7 @@ async def appleID_admin(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     message += "🔄 /replace_phone - Update phone number\n"
     message += "🗑 /remove_pair - Remove a pair\n"
     message += "📋 /list_pairs - View all pairs\n"
+    message += "💾 /backup - Back up the database now\n"
     message += "🔙 /back - Main menu"
     await update.message.reply_text(message)
 
@@ -438,7 +667,7 @@ async def register_pair(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         await update.message.reply_text("⛔ Admin access required")
         return
 
-    admin_data_store[update.effective_user.id] = {
+    get_admin_store(context)[update.effective_user.id] = {
         "command": "register_pair", 
         "step": 1  # Step 1: Apple ID
     }
@@ -453,7 +682,7 @@ async def replace_phone(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         await update.message.reply_text("⛔ Admin access required")
         return
 
-    admin_data_store[update.effective_user.id] = {
+    get_admin_store(context)[update.effective_user.id] = {
         "command": "replace_phone", 
         "step": 1  # Step 1: Waiting for Apple ID
     }
@@ -465,7 +694,7 @@ async def remove_pair_command(update: Update, context: ContextTypes.DEFAULT_TYPE
         await update.message.reply_text("⛔ Admin access required")
         return
 
-    admin_data_store[update.effective_user.id] = {
+    get_admin_store(context)[update.effective_user.id] = {
         "command": "remove_pair", 
         "step": 1  # Step 1: Waiting for Apple ID
     }
@@ -477,7 +706,7 @@ async def list_pairs(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         await update.message.reply_text("⛔ Admin access required")
         return
 
-    pairs = get_all_pairs()
+    pairs = get_all_pairs(tenant=get_tenant(context))
     if not pairs:
         await update.message.reply_text("ℹ️ No accounts registered yet")
     else:
@@ -494,6 +723,28 @@ async def list_pairs(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         await update.message.reply_text(message)
     await appleID_admin(update, context)
 
+async def backup(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Admin command to snapshot the database while the bot keeps running"""
+    if not is_admin(update.effective_user):
+        await update.message.reply_text("⛔ Admin access required")
+        return
+
+    await update.message.reply_text("💾 Backing up the database...")
+    try:
+        stats = await run_backup()
+    except Exception as e:
+        await update.message.reply_text(f"❌ Backup failed: {str(e)}")
+        return
+
+    await update.message.reply_text(
+        f"✅ Backup saved: {stats['file']}\n"
+        f"📦 Size: {stats['size_bytes'] / 1024:.1f} KB\n"
+        f"⏱ Took {stats['duration_ms']:.0f} ms in {stats['steps']} steps "
+        f"(longest step {stats['max_step_ms']:.1f} ms)\n"
+        f"🗑 Old backups removed: {stats['pruned']}\n"
+        f"📊 Runs: {backup_stats['runs']}, failures: {backup_stats['failures']}"
+    )
+
 async def back(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Return to main menu"""
     if is_admin(update.effective_user):
@@ -503,7 +754,9 @@ async def back(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
 async def handle_admin_input(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     user_id = update.effective_user.id
-    command_data = admin_data_store.get(user_id, {})
+    tenant = get_tenant(context)
+    admin_store = get_admin_store(context)
+    command_data = admin_store.get(user_id, {})
     command = command_data.get("command")
     user_input = update.message.text.strip()
 
@@ -520,14 +773,14 @@ async def handle_admin_input(update: Update, context: ContextTypes.DEFAULT_TYPE)
                     return  # Stay in same step until valid input
                 
                 # Check if Apple ID already exists
-                if apple_id_exists(user_input):
+                if apple_id_exists(user_input, tenant=tenant):
                     await update.message.reply_text(
                         "❌ This Apple ID is already registered!\n"
                         "Please enter a different Apple ID:"
                     )
                     return
 
-                admin_data_store[user_id] = {
+                admin_store[user_id] = {
                     "command": "register_pair",
                     "step": 2,
                     "apple_id": user_input
@@ -560,7 +813,8 @@ async def handle_admin_input(update: Update, context: ContextTypes.DEFAULT_TYPE)
                 success = add_pair(
                     apple_id=command_data["apple_id"],
                     phone=user_input,
-                    added_by=update.effective_user.username or str(user_id)
+                    added_by=update.effective_user.username or str(user_id),
+                    tenant=tenant
                 )
 
                 if not success:
@@ -572,16 +826,16 @@ async def handle_admin_input(update: Update, context: ContextTypes.DEFAULT_TYPE)
                         f"Phone: {user_input}"
                     )
                 
-                admin_data_store.pop(user_id, None)
+                admin_store.pop(user_id, None)
                 await appleID_admin(update, context)
                 return
 
         elif command == "replace_phone":
             if command_data.get("step") == 1:
-                if not apple_id_exists(user_input):
+                if not apple_id_exists(user_input, tenant=tenant):
                     raise ValueError("Apple ID not found in registered pairs")
                 
-                admin_data_store[user_id] = {
+                admin_store[user_id] = {
                     "command": "replace_phone",
                     "step": 2,
                     "apple_id": user_input
@@ -592,7 +846,8 @@ async def handle_admin_input(update: Update, context: ContextTypes.DEFAULT_TYPE)
             elif command_data.get("step") == 2:
                 success = update_phone(
                     apple_id=command_data["apple_id"],
-                    new_phone=user_input
+                    new_phone=user_input,
+                    tenant=tenant
                 )
 
                 if not success:
@@ -604,16 +859,16 @@ async def handle_admin_input(update: Update, context: ContextTypes.DEFAULT_TYPE)
                     f"Apple ID: {command_data['apple_id']}\n"
                     f"New phone: {user_input}"
                 )
-                admin_data_store.pop(user_id, None)
+                admin_store.pop(user_id, None)
                 await appleID_admin(update, context)
                 return
 
         elif command == "remove_pair":
             if command_data.get("step") == 1:
-                if not apple_id_exists(user_input):
+                if not apple_id_exists(user_input, tenant=tenant):
                     raise ValueError("Apple ID not found in registered pairs")
                 
-                success = remove_pair(user_input)
+                success = remove_pair(user_input, tenant=tenant)
                 
                 if not success:
                     await update.message.reply_text("❌ Failed to remove the pair")
@@ -623,7 +878,7 @@ async def handle_admin_input(update: Update, context: ContextTypes.DEFAULT_TYPE)
                         f"Apple ID: {user_input}"
                     )
                 
-                admin_data_store.pop(user_id, None)
+                admin_store.pop(user_id, None)
                 await appleID_admin(update, context)
                 return
 
@@ -633,7 +888,7 @@ async def handle_admin_input(update: Update, context: ContextTypes.DEFAULT_TYPE)
             await appleID_admin(update, context)
     except Exception as e:
         await update.message.reply_text(f"❌ Operation failed: {str(e)}")
-        admin_data_store.pop(user_id, None)
+        admin_store.pop(user_id, None)
         await appleID_admin(update, context)
 
 async def handle_all_messages(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -641,10 +896,10 @@ async def handle_all_messages(update: Update, context: ContextTypes.DEFAULT_TYPE
     user_id = update.effective_user.id
     
     # Check if this is an admin in the middle of a command
-    if user_id in admin_data_store:
+    if user_id in get_admin_store(context):
         await handle_admin_input(update, context)
     # Check if this is a regular user in verification flow
-    elif update.effective_chat.id in user_data_store:
+    elif update.effective_chat.id in get_user_store(context):
         await handle_user_message(update, context)
     else:
         # If none of the above, show appropriate commands
@@ -654,11 +909,12 @@ async def handle_all_messages(update: Update, context: ContextTypes.DEFAULT_TYPE
             await show_user_commands(update)
 
 # ================= MAIN APPLICATION =================
-def main() -> None:
-    # Initialize database
-    init_db()
-    
-    app = Application.builder().token(TOKEN).build()
+def build_application(tenant: str, token: str) -> Application:
+    """Create one bot Application; all of them share the DB connection and scraper cache"""
+    init_db(tenant)
+
+    app = Application.builder().token(token).post_init(_post_init).post_shutdown(_post_shutdown).build()
+    app.bot_data["tenant"] = tenant
     
     # Command handlers
     app.add_handler(CommandHandler("start", start))
@@ -669,11 +925,61 @@ def main() -> None:
     app.add_handler(CommandHandler("replace_phone", replace_phone))
     app.add_handler(CommandHandler("remove_pair", remove_pair_command))
     app.add_handler(CommandHandler("list_pairs", list_pairs))
+    app.add_handler(CommandHandler("backup", backup))
     
     # Message handler - now using a single handler for all messages
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_all_messages))
     
-    app.run_polling()
+    return app
+
+async def _post_init(app: Application) -> None:
+    start_backup_scheduler()
+
+async def _post_shutdown(app: Application) -> None:
+    await stop_backup_scheduler()
+
+async def run_applications(apps: list) -> None:
+    """Poll several bots on one event loop until SIGINT/SIGTERM"""
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:  # Windows
+            pass
+
+    started = []
+    try:
+        for app in apps:
+            await app.initialize()
+            await app.start()
+            await app.updater.start_polling()
+            started.append(app)
+            # Same hooks run_polling() calls for a single bot
+            await app.post_init(app)
+        await stop_event.wait()
+    finally:
+        # One bot failing to stop must not leave the others (or the backup task) running
+        for app in reversed(started):
+            tenant = app.bot_data.get("tenant", DEFAULT_TENANT)
+            try:
+                await app.updater.stop()
+                await app.stop()
+                await app.shutdown()
+            except Exception as e:
+                print(f"Error stopping bot {tenant}: {e}")
+            try:
+                await app.post_shutdown(app)
+            except Exception as e:
+                print(f"Error in post_shutdown for bot {tenant}: {e}")
+
+def main() -> None:
+    apps = [build_application(tenant, token) for tenant, token in load_bot_tokens().items()]
+
+    if len(apps) == 1:
+        apps[0].run_polling()
+    else:
+        asyncio.run(run_applications(apps))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file